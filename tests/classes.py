@@ -1,9 +1,10 @@
+import secrets
 import time
 
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 from functools import cached_property
 
-from dataclasses import replace, dataclass
+from dataclasses import dataclass
 
 from aioauth.config import Settings
 from aioauth.grant_type import GrantTypeBase
@@ -22,6 +23,8 @@ from aioauth.types import (
 
 @dataclass(frozen=True)
 class User:
+    __slots__ = ("username",)
+
     username: str
 
 
@@ -31,22 +34,47 @@ class Storage(BaseStorage):
         authorization_codes: List[AuthorizationCode],
         clients: List[Client],
         tokens: List[Token],
-        users: Dict[str, str] = {},
+        users: Optional[Dict[str, str]] = None,
     ):
         self.clients: List[Client] = clients
         self.tokens: List[Token] = tokens
         self.authorization_codes: List[AuthorizationCode] = authorization_codes
-        self.users: Dict[str, str] = users
+        self.users: Dict[str, str] = users if users is not None else {}
+
+        # Lookup indexes kept in sync with the lists above.
+        self._clients_by_id: Dict[str, Client] = {
+            client.client_id: client for client in clients
+        }
+
+        self._tokens_by_access: Dict[Tuple[str, str], Token] = {
+            (token.client_id, token.access_token): token for token in tokens
+        }
+        self._tokens_by_refresh: Dict[Tuple[str, str], Token] = {
+            (token.client_id, token.refresh_token): token
+            for token in tokens
+            if token.refresh_token is not None
+        }
+
+        self._codes: Dict[Tuple[str, str], AuthorizationCode] = {
+            (authorization_code.client_id, authorization_code.code): authorization_code
+            for authorization_code in authorization_codes
+        }
+
+    def _index_token(self, token: Token):
+        self._tokens_by_access[(token.client_id, token.access_token)] = token
+        if token.refresh_token is not None:
+            self._tokens_by_refresh[(token.client_id, token.refresh_token)] = token
 
     def _get_by_client_secret(self, client_id: str, client_secret: str):
-        for client in self.clients:
-            if client.client_id == client_id and client.client_secret == client_secret:
-                return client
+        client = self._clients_by_id.get(client_id)
+        # compare_digest rejects non-ASCII str, so compare encoded bytes.
+        if client is not None and secrets.compare_digest(
+            client.client_secret.encode(), client_secret.encode()
+        ):
+            return client
 
     def _get_by_client_id(self, client_id: str):
-        for client in self.clients:
-            if client.client_id == client_id:
-                return client
+        return self._clients_by_id.get(client_id)
 
     async def get_client(
         self,
@@ -69,17 +97,19 @@ class Storage(BaseStorage):
         access_token: str,
         refresh_token: Optional[str] = None,
     ):
+        settings = request.settings
         token: Token = Token(
             client_id=client_id,
-            expires_in=request.settings.TOKEN_EXPIRES_IN,
-            refresh_token_expires_in=request.settings.REFRESH_TOKEN_EXPIRES_IN,
+            expires_in=settings.TOKEN_EXPIRES_IN,
+            refresh_token_expires_in=settings.REFRESH_TOKEN_EXPIRES_IN,
             access_token=access_token,
             refresh_token=refresh_token,
-            issued_at=int(time.time()),
+            issued_at=time.time_ns() // 1_000_000_000,
             scope=scope,
             revoked=False,
         )
         self.tokens.append(token)
+        self._index_token(token)
         return token
 
     async def revoke_token(
@@ -91,12 +121,15 @@ class Storage(BaseStorage):
         token_type: Optional[TokenType] = None,
         access_token: Optional[str] = None,
     ) -> None:
-        tokens = self.tokens
-        for key, token_ in enumerate(tokens):
-            if token_.refresh_token == refresh_token:
-                tokens[key] = replace(token_, revoked=True)
-            elif token_.access_token == access_token:
-                tokens[key] = replace(token_, revoked=True)
+        # Token is not frozen, so the indexed instance is flipped in place.
+        if refresh_token is not None:
+            token_ = self._tokens_by_refresh.get((client_id, refresh_token))
+            if token_ is not None:
+                token_.revoked = True
+        if access_token is not None:
+            token_ = self._tokens_by_access.get((client_id, access_token))
+            if token_ is not None:
+                token_.revoked = True
 
     async def get_token(
         self,
@@ -107,19 +140,12 @@ class Storage(BaseStorage):
         access_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
     ) -> Optional[Token]:
-        for token_ in self.tokens:
-            if (
-                refresh_token is not None
-                and refresh_token == token_.refresh_token
-                and client_id == token_.client_id
-            ):
-                return token_
-            if (
-                access_token is not None
-                and access_token == token_.access_token
-                and client_id == token_.client_id
-            ):
-                return token_
+        token_: Optional[Token] = None
+        if refresh_token is not None:
+            token_ = self._tokens_by_refresh.get((client_id, refresh_token))
+        if token_ is None and access_token is not None:
+            token_ = self._tokens_by_access.get((client_id, access_token))
+        return token_
 
     async def get_user(self, request: Request) -> Any:
         password = request.post.password
@@ -128,7 +154,10 @@ class Storage(BaseStorage):
         if username is None or password is None:
             return None
 
-        user_exists = username in self.users and self.users[username] == password
+        stored_password = self.users.get(username)
+        user_exists = stored_password is not None and secrets.compare_digest(
+            stored_password.encode(), password.encode()
+        )
 
         if user_exists:
             return User(username=username)
@@ -152,13 +181,14 @@ class Storage(BaseStorage):
             redirect_uri=redirect_uri,
             response_type=response_type,
             scope=scope,
-            auth_time=int(time.time()),
+            auth_time=time.time_ns() // 1_000_000_000,
             code_challenge_method=code_challenge_method,
             code_challenge=code_challenge,
             expires_in=request.settings.AUTHORIZATION_CODE_EXPIRES_IN,
             nonce=nonce,
         )
         self.authorization_codes.append(authorization_code)
+        self._codes[(client_id, code)] = authorization_code
 
         return authorization_code
 
@@ -169,12 +199,7 @@ class Storage(BaseStorage):
         client_id: str,
         code: str,
     ) -> Optional[AuthorizationCode]:
-        for authorization_code in self.authorization_codes:
-            if (
-                authorization_code.code == code
-                and authorization_code.client_id == client_id
-            ):
-                return authorization_code
+        return self._codes.get((client_id, code))
 
     async def delete_authorization_code(
         self,
@@ -183,13 +208,13 @@ class Storage(BaseStorage):
         client_id: str,
         code: str,
     ):
-        authorization_codes = self.authorization_codes
-        for authorization_code in authorization_codes:
-            if (
-                authorization_code.client_id == client_id
-                and authorization_code.code == code
-            ):
-                authorization_codes.remove(authorization_code)
+        authorization_code = self._codes.pop((client_id, code), None)
+        if authorization_code is not None:
+            # Filter by identity: list.remove() compares with __eq__ and
+            # could drop an equal code belonging to another entry.
+            self.authorization_codes[:] = [
+                ac for ac in self.authorization_codes if ac is not authorization_code
+            ]
 
     async def get_id_token(
         self,
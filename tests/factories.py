@@ -44,29 +44,41 @@ def generate_code() -> str:
 
 
 def auth_time_factory() -> int:
-    return int(time.time())
+    return time.time_ns() // 1_000_000_000
+
+
+# Dispatch tables are only read by `AuthorizationServer`, so every context
+# shares the same instances instead of rebuilding them.
+GRANT_TYPES: Dict[GrantType, Type[GrantTypeBase]] = {
+    "authorization_code": AuthorizationCodeGrantType,
+    "client_credentials": ClientCredentialsGrantType,
+    "password": PasswordGrantType,
+    "refresh_token": RefreshTokenGrantType,
+}
+
+RESPONSE_TYPES: Dict[ResponseType, Type[ResponseTypeBase]] = {
+    "code": ResponseTypeAuthorizationCode,
+    "id_token": ResponseTypeIdToken,
+    "none": ResponseTypeNone,
+    "token": ResponseTypeToken,
+}
 
 
 def grant_types_factory() -> Dict[GrantType, Type[GrantTypeBase]]:
-    return {
-        "authorization_code": AuthorizationCodeGrantType,
-        "client_credentials": ClientCredentialsGrantType,
-        "password": PasswordGrantType,
-        "refresh_token": RefreshTokenGrantType,
-    }
+    return GRANT_TYPES
 
 
 def response_types_factory() -> Dict[ResponseType, Type[ResponseTypeBase]]:
-    return {
-        "code": ResponseTypeAuthorizationCode,
-        "id_token": ResponseTypeIdToken,
-        "none": ResponseTypeNone,
-        "token": ResponseTypeToken,
-    }
+    return RESPONSE_TYPES
+
+
+# Shared by every context; tests needing different values build their own
+# `Settings` rather than mutating this one.
+SETTINGS = Settings(INSECURE_TRANSPORT=True)
 
 
 def settings_factory() -> Settings:
-    return Settings(INSECURE_TRANSPORT=True)
+    return SETTINGS
 
 
 def client_factory(
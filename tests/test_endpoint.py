@@ -237,6 +237,64 @@ async def test_revoke_refresh_token(context: AuthorizationContext):
     assert not response.content["active"], "The refresh_token must be revoked"
 
 
+@pytest.mark.asyncio
+async def test_revoke_refresh_token_scoped_to_client():
+    client_a = factories.client_factory(
+        client_id=factories.client_id_factory(),
+        client_secret=factories.client_secret_factory(),
+    )
+    client_b = factories.client_factory(
+        client_id=factories.client_id_factory(),
+        client_secret=factories.client_secret_factory(),
+    )
+    access_token = factories.access_token_factory()
+    refresh_token = factories.refresh_token_factory()
+    context = factories.context_factory(
+        clients=[client_a, client_b],
+        initial_tokens=[
+            factories.token_factory(
+                access_token=access_token,
+                client_id=client.client_id,
+                refresh_token=refresh_token,
+            )
+            for client in (client_a, client_b)
+        ],
+    )
+    settings = context.settings
+    server = context.server
+
+    post = Post(token=refresh_token, token_type_hint="refresh_token")
+    request = Request(
+        post=post,
+        method="POST",
+        headers=encode_auth_headers(client_a.client_id, client_a.client_secret),
+        settings=settings,
+    )
+
+    response = await server.revoke_token(request)
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    # Client B's token with the same value must remain active
+    request = Request(
+        settings=settings,
+        post=post,
+        method="POST",
+        headers=encode_auth_headers(client_b.client_id, client_b.client_secret),
+    )
+    response = await server.create_token_introspection_response(request)
+    assert response.content["active"], "Only client A's token must be revoked"
+
+    # Client A's token is revoked
+    request = Request(
+        settings=settings,
+        post=post,
+        method="POST",
+        headers=encode_auth_headers(client_a.client_id, client_a.client_secret),
+    )
+    response = await server.create_token_introspection_response(request)
+    assert not response.content["active"], "The refresh_token must be revoked"
+
+
 @pytest.mark.asyncio
 async def test_revoke_access_token(context: AuthorizationContext):
     client = context.clients[0]
@@ -355,6 +355,33 @@ async def test_password_grant_type_without_client_secret_using_basic_auth():
     assert response.status_code == HTTPStatus.OK
 
 
+@pytest.mark.asyncio
+async def test_password_grant_type_non_ascii_wrong_password(context_factory):
+    username = "username"
+    context = context_factory(users={username: "pässword"})
+    server = context.server
+    client = context.clients[0]
+    request_url = "https://localhost"
+
+    post = Post(
+        grant_type="password",
+        username=username,
+        password="wrong-ä",
+    )
+
+    request = Request(
+        post=post,
+        url=request_url,
+        method="POST",
+        headers=encode_auth_headers(client.client_id, client.client_secret),
+    )
+
+    response = await server.create_token_response(request)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.content["error"] == "invalid_request"
+    assert response.content["description"] == "Invalid credentials given."
+
+
 @pytest.mark.asyncio
 async def test_authorization_code_flow():
     client = factories.client_factory(client_secret="")
@@ -487,6 +514,28 @@ async def test_client_credentials_flow_post_data(context: AuthorizationContext):
     assert response.status_code == HTTPStatus.OK
 
 
+@pytest.mark.asyncio
+async def test_client_credentials_flow_non_ascii_wrong_secret(
+    context: AuthorizationContext,
+):
+    server = context.server
+    client = context.clients[0]
+    request_url = "https://localhost"
+
+    post = Post(
+        client_id=client.client_id,
+        client_secret="sécret",
+        grant_type="client_credentials",
+        scope=client.scope,
+    )
+
+    request = Request(url=request_url, post=post, method="POST")
+
+    response = await server.create_token_response(request)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.content["error"] == "invalid_client"
+
+
 @pytest.mark.asyncio
 async def test_client_credentials_flow_auth_header(context: AuthorizationContext):
     server = context.server